@@ -11,24 +11,121 @@ __notice__ = "Copyright (c) I. Ahmad (izxxr) 2022-2023"
 __author__ = "I. Ahmad (izxxr) <nerdguyahmad.contact@gmail.com>"
 __url__ = "https://github.com/izxxr/luster"
 
+from typing import TYPE_CHECKING, Any
+
+import importlib as _importlib
 
 # Sort alphabatically
 # Exception: Imports like 'from luster import events as events' should 
 # be kept on top.
 
 from luster import events as events
-from luster.cache import *
-from luster.channels import *
-from luster.client import *
-from luster.enums import *
-from luster.exceptions import *
-from luster.file import *
-from luster.http import *
-from luster.object import *
-from luster.permissions import *
-from luster.protocols import *
-from luster.server import *
-from luster.state import *
-from luster.system_messages import *
-from luster.users import *
-from luster.websocket import *
+from luster import types as types
+
+if TYPE_CHECKING:
+    from luster.cache import *
+    from luster.channels import *
+    from luster.client import *
+    from luster.enums import *
+    from luster.exceptions import *
+    from luster.file import *
+    from luster.http import *
+    from luster.object import *
+    from luster.permissions import *
+    from luster.protocols import *
+    from luster.server import *
+    from luster.state import *
+    from luster.system_messages import *
+    from luster.users import *
+    from luster.websocket import *
+
+# The public names are resolved on first access (PEP 562) so importing
+# the package does not eagerly load every submodule and aiohttp with it.
+_LAZY_IMPORTS = {
+    "Cache": "luster.cache",
+    "ServerChannel": "luster.channels",
+    "TextChannel": "luster.channels",
+    "VoiceChannel": "luster.channels",
+    "PrivateChannel": "luster.channels",
+    "SavedMessages": "luster.channels",
+    "DirectMessage": "luster.channels",
+    "Group": "luster.channels",
+    "Category": "luster.channels",
+    "Client": "luster.client",
+    "WebsocketEvent": "luster.enums",
+    "FileType": "luster.enums",
+    "RelationshipStatus": "luster.enums",
+    "PresenceType": "luster.enums",
+    "FileTag": "luster.enums",
+    "ChannelType": "luster.enums",
+    "LusterException": "luster.exceptions",
+    "WebsocketError": "luster.exceptions",
+    "HTTPException": "luster.exceptions",
+    "HTTPNotFound": "luster.exceptions",
+    "HTTPForbidden": "luster.exceptions",
+    "HTTPServerError": "luster.exceptions",
+    "File": "luster.file",
+    "PartialUploadedFile": "luster.file",
+    "HTTPHandler": "luster.http",
+    "create_http_handler": "luster.http",
+    "Object": "luster.object",
+    "Permissions": "luster.permissions",
+    "PermissionOverwrite": "luster.permissions",
+    "Role": "luster.permissions",
+    "BaseModel": "luster.protocols",
+    "Server": "luster.server",
+    "State": "luster.state",
+    "SystemMessages": "luster.system_messages",
+    "User": "luster.users",
+    "Relationship": "luster.users",
+    "Profile": "luster.users",
+    "Status": "luster.users",
+    "PartialUserBot": "luster.users",
+    "WebsocketHandler": "luster.websocket",
+}
+
+# Submodules were bound by the star imports before names were resolved
+# lazily, so they are still importable through attribute access.
+_SUBMODULES = frozenset((
+    "cache",
+    "channels",
+    "client",
+    "enums",
+    "exceptions",
+    "file",
+    "flags",
+    "http",
+    "internal",
+    "object",
+    "permissions",
+    "protocols",
+    "server",
+    "state",
+    "system_messages",
+    "users",
+    "websocket",
+))
+
+__all__ = (
+    "events",
+    "types",
+    *_LAZY_IMPORTS,
+)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        if name in _SUBMODULES:
+            # Importing binds the submodule on the package as well
+            return _importlib.import_module(f"{__name__}.{name}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> Any:
+    return sorted({*globals(), *_LAZY_IMPORTS, *_SUBMODULES})
@@ -2,46 +2,187 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Collection, Dict, Iterable, List, Optional
 from luster.internal.mixins import StateManagementMixin
+from collections import OrderedDict
+from weakref import WeakValueDictionary
+
+import sys
 
 if TYPE_CHECKING:
     from luster.users import User
     from luster.server import Server
     from luster.channels import ChannelT
 
+__all__ = (
+    "Cache",
+)
+
+# Cache operations sit on the websocket ingest path so every accessor
+# touches its bucket with the fewest possible operations: ``get_*`` and
+# ``remove_*`` perform a single ``get()`` or ``pop()`` while ``add_*``
+# performs one ``get()`` for returning the replaced entity and one ``[]=``.
+# Avoid ``if key in bucket: return bucket[key]`` style checks which hash
+# the key twice; when some "update if present" logic is needed, use
+# ``existing = bucket.get(key)`` followed by ``if existing is not None``.
+#
+# Keys are interned when entities are added so that a re-added ID reuses
+# one string object and lookups made with that object short-circuit on
+# identity. Lookup keys are deliberately not interned: that costs a probe
+# of the interpreter's intern table, which is more than the string comparison
+# it would save. For the same reason IDs stay as ``str`` keys rather than
+# being decoded into integers; ``str`` caches its hash, while decoding a
+# ULID in Python on every call costs far more than the lookup itself.
+#
+# Buckets are not pre-sized. CPython offers no way to reserve dict capacity:
+# ``dict.clear()`` releases the table and deleted keys keep consuming entry
+# slots, so seeding a bucket with placeholder keys does not avoid resizes.
+# The ``bulk_add_*`` methods instead merge a fully built dict which lets
+# ``dict.update`` size the bucket once for the whole batch.
+
+
+def _key(entity: Any) -> str:
+    return sys.intern(entity.id)
+
+
+def _make_room(bucket: OrderedDict[str, Any], key: str, limit: int) -> None:
+    # Marks an existing key as most recently used or evicts the
+    # least recently used entity when a new key would exceed limit.
+    try:
+        bucket.move_to_end(key)
+    except KeyError:
+        if len(bucket) >= limit:
+            bucket.popitem(last=False)
+
 
 class Cache(StateManagementMixin):
     """A class that handles caching of various entities from Revolt API.
 
     This acts as  a base class for custom cache handlers. You may inherit
     this class to implement custom caching using a separate service
-    such as Redis.
+    such as Redis. The underlying buckets are exposed to subclasses as
+    protected attributes, see :ref:`api-caching-custom-handler`.
 
     The possible ways of accessing the instance of this object is:
 
     - :attr:`State.cache`
     - :attr:`Client.cache`
+
+    By default, the cache grows without any bounds. For long running
+    bots, the size of each entity bucket can be limited in which case
+    the least recently used entities are evicted when the limit is hit.
+
+    Parameters
+    ----------
+    max_users: Optional[:class:`int`]
+        The maximum number of users to cache. ``None`` (default) means
+        no limit.
+    max_servers: Optional[:class:`int`]
+        The maximum number of servers to cache. ``None`` (default) means
+        no limit.
+    max_channels: Optional[:class:`int`]
+        The maximum number of channels to cache. ``None`` (default) means
+        no limit.
     """
 
-    def __init__(self) -> None:
-        self.clear()
+    if TYPE_CHECKING:
+        _store: Dict[str, Dict[str, Any]]
+        _users: Dict[str, User]
+        _servers: Dict[str, Server]
+        _channels: Dict[str, ChannelT]
+        _users_by_name: Optional[WeakValueDictionary[str, User]]
+
+    __slots__ = (
+        "_store",
+        "_users",
+        "_servers",
+        "_channels",
+        "_max_users",
+        "_max_servers",
+        "_max_channels",
+        "_users_by_name",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_users: Optional[int] = None,
+        max_servers: Optional[int] = None,
+        max_channels: Optional[int] = None,
+    ) -> None:
+        for limit in (max_users, max_servers, max_channels):
+            if limit is not None and limit < 1:
+                raise ValueError("Cache size limits must be greater than zero")
+
+        self._state = None
+        self._max_users = max_users
+        self._max_servers = max_servers
+        self._max_channels = max_channels
+
+        # Secondary indexes only hold weak references so that replaced
+        # entities are not kept alive by them. They are built on first use
+        # so that adding entities does not pay for indexes nobody queries.
+        self._users_by_name = None
+
+        # The per-type attributes alias the registry buckets so that
+        # the accessors below resolve their bucket with a single slot load.
+        # Only bounded buckets pay for the ordering kept by OrderedDict.
+        self._store = store = {}
+        self._users = store["users"] = {} if max_users is None else OrderedDict()
+        self._servers = store["servers"] = {} if max_servers is None else OrderedDict()
+        self._channels = store["channels"] = {} if max_channels is None else OrderedDict()
 
     def clear(self) -> None:
-        self.__users: Dict[str, User] = {}
-        self.__servers: Dict[str, Server] = {}
-        self.__channels: Dict[str, ChannelT] = {}
+        """Removes all entities from the cache.
+
+        The underlying buckets are emptied in place so views returned
+        by :meth:`.users`, :meth:`.servers` and :meth:`.channels` stay
+        attached to the cache.
+        """
+        for bucket in self._store.values():
+            bucket.clear()
+
+        self._users_by_name = None
 
-    def users(self) -> List[User]:
+    def _bulk_add(self, bucket: Dict[str, Any], limit: Optional[int], entities: Iterable[Any]) -> None:
+        # Inlined equivalent of _key() with names bound to locals; this is
+        # the template for any further bulk operations.
+        intern = sys.intern
+
+        if limit is None:
+            bucket.update({intern(entity.id): entity for entity in entities})
+            return
+
+        push = bucket.__setitem__
+
+        for entity in entities:
+            key = intern(entity.id)
+            _make_room(bucket, key, limit)  # type: ignore
+            push(key, entity)
+
+    def users(self) -> Collection[User]:
         """The users that are currently cached.
 
+        The returned collection is a live view of the cache and
+        reflects any later changes to it. Use :meth:`.snapshot_users`
+        if the cache may be modified while iterating.
+
+        Returns
+        -------
+        Collection[:class:`User`]
+        """
+        return self._users.values()
+
+    def snapshot_users(self) -> List[User]:
+        """Returns a copy of the users that are currently cached.
+
         Returns
         -------
         List[:class:`User`]
         """
-        return list(self.__users.values())
+        return list(self._users.values())
 
-    def add_user(self, user: User) -> None:
+    def add_user(self, user: User) -> Optional[User]:
         """Adds a new user to the cache.
 
         If a similar user already exists, It will be overwritten.
@@ -50,8 +191,54 @@ class Cache(StateManagementMixin):
         ----------
         user: :class:`User`
             The user to add.
+
+        Returns
+        -------
+        Optional[:class:`User`]
+            The user that was overwritten; if any. Otherwise ``None``.
         """
-        self.__users[user.id] = user
+        key = _key(user)
+        users = self._users
+        limit = self._max_users
+
+        if limit is not None:
+            _make_room(users, key, limit)  # type: ignore
+
+        previous = users.get(key)
+        users[key] = user
+
+        by_name = self._users_by_name
+        if by_name is not None:
+            by_name[user.username] = user
+
+        return previous
+
+    def bulk_add_users(self, users: Iterable[User]) -> None:
+        """Adds multiple users to the cache at once.
+
+        This is equivalent to calling :meth:`.add_user` for each user
+        but is considerably faster for large batches. This should be
+        preferred when filling the cache from API responses.
+
+        Parameters
+        ----------
+        users: Iterable[:class:`User`]
+            The users to add.
+        """
+        if type(self).add_user is not Cache.add_user:
+            # Overridden add_user() is the extension point for custom caches
+            for user in users:
+                self.add_user(user)
+            return
+
+        by_name = self._users_by_name
+        if by_name is None:
+            self._bulk_add(self._users, self._max_users, users)
+            return
+
+        users = list(users)
+        self._bulk_add(self._users, self._max_users, users)
+        by_name.update({user.username: user for user in users})
 
     def get_user(self, user_id: str) -> Optional[User]:
         """Gets a user from the cache.
@@ -66,7 +253,13 @@ class Cache(StateManagementMixin):
         Optional[:class:`User`]
             The requested user; if exists. Otherwise ``None``.
         """
-        return self.__users.get(user_id)
+        users = self._users
+        user = users.get(user_id)
+
+        if user is not None and self._max_users is not None:
+            users.move_to_end(user_id)  # type: ignore
+
+        return user
 
     def remove_user(self, user_id: str) -> Optional[User]:
         """Removes a user from the cache.
@@ -81,18 +274,78 @@ class Cache(StateManagementMixin):
         Optional[:class:`User`]
             The remoevd user; if exists. Otherwise ``None``.
         """
-        return self.__users.pop(user_id, None)
+        user = self._users.pop(user_id, None)
+
+        if user is not None:
+            by_name = self._users_by_name
+            if by_name is not None and by_name.get(user.username) is user:
+                del by_name[user.username]
+
+        return user
+
+    def get_user_by_name(self, username: str) -> Optional[User]:
+        """Gets a user from the cache by their username.
+
+        The first call builds an index of cached users by username
+        which is then kept up to date as users are added or removed.
+        Users whose username has changed are looked up by scanning
+        the cache once and are then indexed under the new username.
+
+        Parameters
+        ----------
+        username: :class:`str`
+            The username of user to get.
+
+        Returns
+        -------
+        Optional[:class:`User`]
+            The requested user; if exists. Otherwise ``None``.
+        """
+        by_name = self._users_by_name
+        if by_name is None:
+            by_name = self._users_by_name = WeakValueDictionary(
+                (user.username, user) for user in self._users.values()
+            )
 
-    def servers(self) -> List[Server]:
+        user = by_name.get(username)
+
+        # The index is not updated on username changes or
+        # evictions so the entry has to be validated.
+        if user is not None and user.username == username and self._users.get(user.id) is user:
+            return user
+
+        # Renamed users are only found by scanning the cache, the
+        # index entry is then refreshed for later lookups.
+        for user in self._users.values():
+            if user.username == username:
+                by_name[username] = user
+                return user
+
+        return None
+
+    def servers(self) -> Collection[Server]:
         """The servers that are currently cached.
 
+        The returned collection is a live view of the cache and
+        reflects any later changes to it. Use :meth:`.snapshot_servers`
+        if the cache may be modified while iterating.
+
+        Returns
+        -------
+        Collection[:class:`Server`]
+        """
+        return self._servers.values()
+
+    def snapshot_servers(self) -> List[Server]:
+        """Returns a copy of the servers that are currently cached.
+
         Returns
         -------
         List[:class:`Server`]
         """
-        return list(self.__servers.values())
+        return list(self._servers.values())
 
-    def add_server(self, server: Server) -> None:
+    def add_server(self, server: Server) -> Optional[Server]:
         """Adds a new server to the cache.
 
         If a similar server already exists, It will be overwritten.
@@ -101,8 +354,41 @@ class Cache(StateManagementMixin):
         ----------
         server: :class:`Server`
             The server to add.
+
+        Returns
+        -------
+        Optional[:class:`Server`]
+            The server that was overwritten; if any. Otherwise ``None``.
         """
-        self.__servers[server.id] = server
+        key = _key(server)
+        servers = self._servers
+        limit = self._max_servers
+
+        if limit is not None:
+            _make_room(servers, key, limit)  # type: ignore
+
+        previous = servers.get(key)
+        servers[key] = server
+        return previous
+
+    def bulk_add_servers(self, servers: Iterable[Server]) -> None:
+        """Adds multiple servers to the cache at once.
+
+        This is equivalent to calling :meth:`.add_server` for each server
+        but is considerably faster for large batches. This should be
+        preferred when filling the cache from API responses.
+
+        Parameters
+        ----------
+        servers: Iterable[:class:`Server`]
+            The servers to add.
+        """
+        if type(self).add_server is not Cache.add_server:
+            for server in servers:
+                self.add_server(server)
+            return
+
+        self._bulk_add(self._servers, self._max_servers, servers)
 
     def get_server(self, server_id: str) -> Optional[Server]:
         """Gets a server from the cache.
@@ -117,7 +403,13 @@ class Cache(StateManagementMixin):
         Optional[:class:`Server`]
             The requested server; if exists. Otherwise ``None``.
         """
-        return self.__servers.get(server_id)
+        servers = self._servers
+        server = servers.get(server_id)
+
+        if server is not None and self._max_servers is not None:
+            servers.move_to_end(server_id)  # type: ignore
+
+        return server
 
     def remove_server(self, server_id: str) -> Optional[Server]:
         """Removes a server from the cache.
@@ -132,18 +424,31 @@ class Cache(StateManagementMixin):
         Optional[:class:`Server`]
             The remoevd server; if exists. Otherwise ``None``.
         """
-        return self.__servers.pop(server_id, None)
+        return self._servers.pop(server_id, None)
 
-    def channels(self) -> List[ChannelT]:
+    def channels(self) -> Collection[ChannelT]:
         """The channels that are currently cached.
 
+        The returned collection is a live view of the cache and
+        reflects any later changes to it. Use :meth:`.snapshot_channels`
+        if the cache may be modified while iterating.
+
+        Returns
+        -------
+        Collection[Union[:class:`ServerChannel`, :class:`PrivateChannel`]]
+        """
+        return self._channels.values()
+
+    def snapshot_channels(self) -> List[ChannelT]:
+        """Returns a copy of the channels that are currently cached.
+
         Returns
         -------
         List[Union[:class:`ServerChannel`, :class:`PrivateChannel`]]
         """
-        return list(self.__channels.values())
+        return list(self._channels.values())
 
-    def add_channel(self, channel: ChannelT) -> None:
+    def add_channel(self, channel: ChannelT) -> Optional[ChannelT]:
         """Adds a new channel to the cache.
 
         If a similar channel already exists, It will be overwritten.
@@ -152,8 +457,41 @@ class Cache(StateManagementMixin):
         ----------
         channel: Union[:class:`ServerChannel`, :class:`PrivateChannel`]
             The channel to add.
+
+        Returns
+        -------
+        Optional[Union[:class:`ServerChannel`, :class:`PrivateChannel`]]
+            The channel that was overwritten; if any. Otherwise ``None``.
         """
-        self.__channels[channel.id] = channel
+        key = _key(channel)
+        channels = self._channels
+        limit = self._max_channels
+
+        if limit is not None:
+            _make_room(channels, key, limit)  # type: ignore
+
+        previous = channels.get(key)
+        channels[key] = channel
+        return previous
+
+    def bulk_add_channels(self, channels: Iterable[ChannelT]) -> None:
+        """Adds multiple channels to the cache at once.
+
+        This is equivalent to calling :meth:`.add_channel` for each channel
+        but is considerably faster for large batches. This should be
+        preferred when filling the cache from API responses.
+
+        Parameters
+        ----------
+        channels: Iterable[Union[:class:`ServerChannel`, :class:`PrivateChannel`]]
+            The channels to add.
+        """
+        if type(self).add_channel is not Cache.add_channel:
+            for channel in channels:
+                self.add_channel(channel)
+            return
+
+        self._bulk_add(self._channels, self._max_channels, channels)
 
     def get_channel(self, channel_id: str) -> Optional[ChannelT]:
         """Gets a channel from the cache.
@@ -168,7 +506,13 @@ class Cache(StateManagementMixin):
         Optional[Union[:class:`ServerChannel`, :class:`PrivateChannel`]]
             The requested channel; if exists. Otherwise ``None``.
         """
-        return self.__channels.get(channel_id)
+        channels = self._channels
+        channel = channels.get(channel_id)
+
+        if channel is not None and self._max_channels is not None:
+            channels.move_to_end(channel_id)  # type: ignore
+
+        return channel
 
     def remove_channel(self, channel_id: str) -> Optional[ChannelT]:
         """Removes a channel from the cache.
@@ -183,4 +527,4 @@ class Cache(StateManagementMixin):
         Optional[Union[:class:`ServerChannel`, :class:`PrivateChannel`]]
             The remoevd channel; if exists. Otherwise ``None``.
         """
-        return self.__channels.pop(channel_id, None)
+        return self._channels.pop(channel_id, None)
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Mapping, Optional, Tuple, Type, Union
 from typing_extensions import Self
 from luster.types.websocket import ChannelUpdateEventData
 from luster.internal.mixins import StateAware
-from luster.internal.update_handler import UpdateHandler, handle_update
-from luster.internal.helpers import MISSING, get_attachment_id, upsert_remove_value
+from luster.internal.update_handler import UpdateHandler, UpdateMap, handle_update
+from luster.internal.helpers import MISSING, get_attachment_id
 from luster.enums import ChannelType
 from luster.file import File
 from luster.users import User
 from luster.protocols import BaseModel
 from luster.permissions import Permissions, PermissionOverwrite
 
+from types import MappingProxyType
+
 if TYPE_CHECKING:
     from io import BufferedReader
     from luster.server import Server
@@ -34,27 +36,36 @@ __all__ = (
 
 ChannelT = Union["ServerChannel", "PrivateChannel"]
 
+# Read-only defaults shared by every channel without permission overwrites.
+# The raw permission attributes are only ever replaced, never mutated.
+_NO_DEFAULT_PERMISSIONS: Mapping[str, int] = MappingProxyType({"a": 0, "d": 0})
+_NO_ROLE_PERMISSIONS: Mapping[str, Any] = MappingProxyType({})
 
-def channel_factory(tp: Any) -> Type[ChannelT]:
-    if tp == ChannelType.TEXT_CHANNEL:
-        return TextChannel
-    if tp == ChannelType.VOICE_CHANNEL:
-        return VoiceChannel
-    if tp == ChannelType.SAVED_MESSAGES:
-        return SavedMessages
-    if tp == ChannelType.DIRECT_MESSAGE:
-        return DirectMessage
-    if tp == ChannelType.GROUP:
-        return Group
 
+def channel_factory(tp: Any) -> Type[ChannelT]:
     # Fallback to PrivateChannel as it is the most
     # minimal channel type
-    return PrivateChannel
+    return _CHANNEL_FACTORY.get(tp, PrivateChannel)
+
+
+def _remove_fields(channel: Any, fields: List[types.ChannelRemoveField]) -> None:
+    mapping = channel._REMOVE_FIELDS
+
+    for field in fields:
+        attr = mapping.get(field)
+        if attr is not None:
+            setattr(channel, attr, None)
 
 
 class _EditChannelMixin(StateAware):
     id: str
 
+    __slots__ = ()
+
+    def _refresh_from_data(self, data: Any) -> None:
+        # Applies the new state to an already initialized channel
+        self._update_from_data(data)  # type: ignore
+
     async def edit(
         self,
         *,
@@ -84,35 +95,29 @@ class _EditChannelMixin(StateAware):
 
         Returns
         -------
-        The updated channel instance or None if no edits were done.
+        This channel, updated in place, or None if no edits were done.
         """
-        json = {}
         http = self._state.http_handler
+        json: Dict[str, Any] = {
+            key: value
+            for key, value in (("name", name), ("description", description), ("nsfw", nsfw))
+            if value is not MISSING and value is not None
+        }
+        remove = [field for field, value in (("Description", description), ("Icon", icon)) if value is None]
 
-        if name:
-            json["name"] = name
-
-        if description is not MISSING:
-            if description is None:
-                upsert_remove_value(json, "Description")
-            else:
-                json["description"] = description
-
-        if icon is not MISSING:
-            if icon is None:
-                upsert_remove_value(json, "Icon")
-            else:
-                json["icon"] = await get_attachment_id(http, icon, "icons")
+        if remove:
+            json["remove"] = remove
 
-        if nsfw is not MISSING:
-            json["nsfw"] = nsfw
+        if icon:
+            json["icon"] = await get_attachment_id(http, icon, "icons")
 
         if json:
             # data is equivalent to types.EditChannelJSON now
             data = await http.edit_channel(self.id, json=json)  # type: ignore
 
-            # self.__class__ will resolve to a valid channel type
-            return self.__class__(data, self._state)  # type: ignore
+            # The response is the complete new state of this channel
+            self._refresh_from_data(data)
+            return self
 
 
 class ServerChannel(_EditChannelMixin, UpdateHandler[ChannelUpdateEventData]):
@@ -146,21 +151,36 @@ class ServerChannel(_EditChannelMixin, UpdateHandler[ChannelUpdateEventData]):
         name: str
         description: Optional[str]
         nsfw: bool
-        _default_permissions: types.Permissions
-        _role_permissions: Dict[str, types.Permissions]
+        _default_permissions: Mapping[str, int]
+        _role_permissions: Mapping[str, types.Permissions]
+        _default_permissions_cache: Optional[PermissionOverwrite]
+        _role_permissions_cache: Optional[Dict[str, PermissionOverwrite]]
 
     __slots__ = (
-        "_state",
         "id",
         "type",
         "server_id",
         "name",
         "description",
         "nsfw",
+        "_default_permissions",
+        "_role_permissions",
+        "_default_permissions_cache",
+        "_role_permissions_cache",
     )
 
+    _REMOVE_FIELDS: ClassVar[Dict[str, str]] = {"Description": "description"}
+
+    _UPDATE_MAP: ClassVar[UpdateMap] = {
+        "name": ("name", None),
+        "description": ("description", None),
+        "nsfw": ("nsfw", None),
+    }
+
     def __init__(self, data: types.ServerChannel, state: State) -> None:
         self._state = state
+        self._default_permissions_cache = None
+        self._role_permissions_cache = None
         self._update_from_data(data)
 
     def _update_from_data(self, data: types.ServerChannel) -> None:
@@ -171,39 +191,35 @@ class ServerChannel(_EditChannelMixin, UpdateHandler[ChannelUpdateEventData]):
         self.description = data.get("description")
         self.nsfw = data.get("nsfw", False)
 
-        self._default_permissions = data.get("default_permissions", {"a": 0, "d": 0})
-        self._role_permissions = data.get("role_permissions", {})
+        self._default_permissions = data.get("default_permissions", _NO_DEFAULT_PERMISSIONS)
+        self._role_permissions = data.get("role_permissions", _NO_ROLE_PERMISSIONS)
 
-    def handle_field_removals(self, fields: List[types.ChannelRemoveField]) -> None:
-        for field in fields:
-            if field == "Icon":
-                self.icon = None
-            if field == "Description":
-                self.description = None
-
-    @handle_update("name")
-    def _handle_update_name(self, new: str) -> None:
-        self.name = new
+    def _refresh_from_data(self, data: types.ServerChannel) -> None:
+        default_permissions = self._default_permissions
+        role_permissions = self._role_permissions
 
-    @handle_update("description")
-    def _handle_update_description(self, new: str) -> None:
-        self.description = new
+        self._update_from_data(data)
 
-    @handle_update("icon")
-    def _handle_update_icon(self, new: types.File) -> None:
-        self.icon = File(new, self._state)
+        # Memoized overwrites survive refreshes that don't change the permissions
+        if self._default_permissions != default_permissions:
+            self._default_permissions_cache = None
+        if self._role_permissions != role_permissions:
+            self._role_permissions_cache = None
 
-    @handle_update("nsfw")
-    def _handle_update_nsfw(self, new: bool) -> None:
-        self.nsfw = new
+    def handle_field_removals(self, fields: List[types.ChannelRemoveField]) -> None:
+        _remove_fields(self, fields)
 
     @handle_update("default_permissions")
     def _handle_update_default_permissions(self, new: types.Permissions) -> None:
-        self._default_permissions = new
+        if new != self._default_permissions:
+            self._default_permissions = new
+            self._default_permissions_cache = None
 
     @handle_update("role_permissions")
     def _handle_update_role_permissions(self, new: Dict[str, types.Permissions]) -> None:
-        self._role_permissions = new
+        if new != self._role_permissions:
+            self._role_permissions = new
+            self._role_permissions_cache = None
 
     @property
     def server(self) -> Optional[Server]:
@@ -223,33 +239,45 @@ class ServerChannel(_EditChannelMixin, UpdateHandler[ChannelUpdateEventData]):
     def default_permissions(self) -> PermissionOverwrite:
         """The default permission overwrite on this channel.
 
+        The overwrite is computed once and reused until the channel's
+        permissions are updated; each access returns a copy of it.
+
         Returns
         -------
         :class:`PermissionOverwrite`
         """
-        allow = Permissions(self._default_permissions["a"])
-        deny = Permissions(self._default_permissions["d"])
-        return PermissionOverwrite.from_pair(allow, deny)
+        overwrite = self._default_permissions_cache
+
+        if overwrite is None:
+            permissions = self._default_permissions
+            overwrite = self._default_permissions_cache = PermissionOverwrite._from_bits(permissions["a"], permissions["d"])
+
+        return overwrite._copy()
 
     @property
-    def role_permissions(self) -> Mapping[str, PermissionOverwrite]:
+    def role_permissions(self) -> Dict[str, PermissionOverwrite]:
         """The role permissions of this channel.
 
         This returns a mapping with key being the ID of role and
         value being the permission overwrite for that role.
 
+        The overwrites are computed once and reused until the channel's
+        permissions are updated; each access returns a new mapping of
+        copies of them.
+
         Returns
         -------
-        Mapping[:class:`str`, :class:`PermissionOverwrite`]
+        Dict[:class:`str`, :class:`PermissionOverwrite`]
         """
-        permissions: Mapping[str, PermissionOverwrite] = {}
+        permissions = self._role_permissions_cache
 
-        for role_id, overwrite in self._role_permissions.items():
-            allow = Permissions(overwrite["a"])
-            deny = Permissions(overwrite["d"])
-            permissions[role_id] = PermissionOverwrite.from_pair(allow, deny)
+        if permissions is None:
+            permissions = self._role_permissions_cache = {
+                role_id: PermissionOverwrite._from_bits(overwrite["a"], overwrite["d"])
+                for role_id, overwrite in self._role_permissions.items()
+            }
 
-        return permissions
+        return {role_id: overwrite._copy() for role_id, overwrite in permissions.items()}
 
     async def delete(self) -> None:
         """Deletes the channel.
@@ -363,6 +391,8 @@ class VoiceChannel(ServerChannel):
     This class inherits the :class:`ServerChannel` class.
     """
 
+    __slots__ = ()
+
 
 class PrivateChannel(StateAware, UpdateHandler[ChannelUpdateEventData]):
     """The common base class for private channels.
@@ -386,11 +416,12 @@ class PrivateChannel(StateAware, UpdateHandler[ChannelUpdateEventData]):
         type: types.ChannelTypePrivate
 
     __slots__ = (
-        "_state",
         "id",
         "type",
     )
 
+    _REMOVE_FIELDS: ClassVar[Dict[str, str]] = {}
+
     def __init__(self, data: types.PrivateChannel, state: State) -> None:
         self._state = state
         self._update_from_data(data)
@@ -400,7 +431,7 @@ class PrivateChannel(StateAware, UpdateHandler[ChannelUpdateEventData]):
         self.type = data["channel_type"]
 
     def handle_field_removals(self, fields: List[types.ChannelRemoveField]) -> None:
-        pass
+        _remove_fields(self, fields)
 
     async def delete(self) -> None:
         """Deletes the channel.
@@ -465,6 +496,11 @@ class DirectMessage(PrivateChannel):
 
     __slots__ = ("recipient_ids", "active", "last_message_id")
 
+    _UPDATE_MAP: ClassVar[UpdateMap] = {
+        "recipients": ("recipient_ids", None),
+        "active": ("active", None),
+    }
+
     def _update_from_data(self, data: types.DirectMessage) -> None:
         super()._update_from_data(data)
 
@@ -472,14 +508,6 @@ class DirectMessage(PrivateChannel):
         self.active = data.get("active", False)
         self.last_message_id = data.get("last_message_id")
 
-    @handle_update("recipients")
-    def _handle_update_recipients(self, new: List[str]) -> None:
-        self.recipient_ids = new
-
-    @handle_update("active")
-    def _handle_update_active(self, new: bool) -> None:
-        self.active = new
-
 
 class Group(PrivateChannel, _EditChannelMixin, UpdateHandler[ChannelUpdateEventData]):
     """Represents a group channel between several users.
@@ -496,8 +524,6 @@ class Group(PrivateChannel, _EditChannelMixin, UpdateHandler[ChannelUpdateEventD
         The IDs of recipients that are in this channel.
     description: Optional[:class:`str`]
         The description of this channel.
-    icon: Optional[:class:`File`]
-        The icon of this channel.
     last_message_id: Optional[:class:`str`]
         The ID of last message sent in this channel.
     nsfw: :class:`bool`
@@ -510,22 +536,39 @@ class Group(PrivateChannel, _EditChannelMixin, UpdateHandler[ChannelUpdateEventD
         owner_id: str
         recipient_ids: List[str]
         description: Optional[str]
-        icon: Optional[File]
         nsfw: bool
         last_message_id: Optional[str]
         permissions: Permissions
+        _icon_data: Optional[types.File]
+        _icon: Optional[File]
 
     __slots__ = (
         "name",
         "owner_id",
         "recipient_ids",
         "description",
-        "icon",
         "nsfw",
         "last_message_id",
         "permissions",
+        "_icon_data",
+        "_icon",
     )
 
+    _REMOVE_FIELDS: ClassVar[Dict[str, str]] = {"Icon": "_icon_data", "Description": "description"}
+
+    _UPDATE_MAP: ClassVar[UpdateMap] = {
+        "name": ("name", None),
+        "recipients": ("recipient_ids", None),
+        "description": ("description", None),
+        "nsfw": ("nsfw", None),
+        "permissions": ("permissions", Permissions),
+    }
+
+    def __init__(self, data: types.Group, state: State) -> None:
+        self._icon = None
+        self._icon_data = None
+        super().__init__(data, state)
+
     def _update_from_data(self, data: types.Group) -> None:
         super()._update_from_data(data)
 
@@ -537,39 +580,37 @@ class Group(PrivateChannel, _EditChannelMixin, UpdateHandler[ChannelUpdateEventD
         self.last_message_id = data.get("last_message_id")
         self.permissions = Permissions(data.get("permissions", 0))
 
+        # The File is only built when the icon is first accessed and
+        # is kept for as long as the icon does not change.
         icon = data.get("icon")
-        self.icon = File(icon, self._state) if icon else None
 
-    def handle_field_removals(self, fields: List[types.ChannelRemoveField]) -> None:
-        for field in fields:
-            if field == "Icon":
-                self.icon = None
-            if field == "Description":
-                self.description = None
+        if icon is None or icon != self._icon_data:
+            self._icon = None
+
+        self._icon_data = icon
 
-    @handle_update("name")
-    def _handle_update_name(self, new: str) -> None:
-        self.name = new
+    @property
+    def icon(self) -> Optional[File]:
+        """The icon of this channel.
+
+        Returns
+        -------
+        Optional[:class:`File`]
+        """
+        data = self._icon_data
 
-    @handle_update("recipients")
-    def _handle_update_recipients(self, new: List[str]) -> None:
-        self.recipient_ids = new
+        if not data:
+            return None
+        if self._icon is None:
+            self._icon = File(data, self._state)
 
-    @handle_update("description")
-    def _handle_update_description(self, new: str) -> None:
-        self.description = new
+        return self._icon
 
     @handle_update("icon")
     def _handle_update_icon(self, new: types.File) -> None:
-        self.icon = File(new, self._state)
-
-    @handle_update("nsfw")
-    def _handle_update_nsfw(self, new: bool) -> None:
-        self.nsfw = new
-
-    @handle_update("permissions")
-    def _handle_update_permissions(self, new: int) -> None:
-        self.permissions = Permissions(new)
+        if new != self._icon_data:
+            self._icon_data = new
+            self._icon = None
 
     async def fetch_owner(self) -> User:
         """Fetches the user that owns this group.
@@ -591,6 +632,8 @@ class Group(PrivateChannel, _EditChannelMixin, UpdateHandler[ChannelUpdateEventD
     async def fetch_recipients(self) -> List[User]:
         """Fetches the users that are part of this group.
 
+        The fetched users are also added to the cache.
+
         Returns
         -------
         List[:class:`User`]
@@ -603,7 +646,9 @@ class Group(PrivateChannel, _EditChannelMixin, UpdateHandler[ChannelUpdateEventD
         """
         state = self._state
         data = await state.http_handler.fetch_group_members(channel_id=self.id)
-        return [User(u, state) for u in data]
+        users = [User(u, state) for u in data]
+        state.cache.bulk_add_users(users)
+        return users
 
     async def add_recipient(self, user: BaseModel) -> None:
         """Adds a new member to this group.
@@ -669,6 +714,18 @@ class Group(PrivateChannel, _EditChannelMixin, UpdateHandler[ChannelUpdateEventD
         return Group(data, self._state)  # type: ignore  # data will always be a GroupChannel
 
 
+# ChannelType members are the plain strings sent over the wire, so this
+# table is keyed by the raw channel_type of payloads and no separate
+# lookup for raw strings is needed.
+_CHANNEL_FACTORY: Dict[str, Type[ChannelT]] = {
+    ChannelType.TEXT_CHANNEL: TextChannel,
+    ChannelType.VOICE_CHANNEL: VoiceChannel,
+    ChannelType.SAVED_MESSAGES: SavedMessages,
+    ChannelType.DIRECT_MESSAGE: DirectMessage,
+    ChannelType.GROUP: Group,
+}
+
+
 class Category(StateAware):
     """Represents a category for other channels.
 
@@ -678,14 +735,20 @@ class Category(StateAware):
         The ID of this category.
     title: :class:`str`
         The title of this category.
-    channel_ids: List[:class:`str`]
-        The list of channel IDs that are in this category.
+    channel_ids: Tuple[:class:`str`, ...]
+        The IDs of channels that are in this category.
     """
 
     if TYPE_CHECKING:
         id: str
         title: str
-        channel_ids: List[str]
+        channel_ids: Tuple[str, ...]
+
+    __slots__ = (
+        "id",
+        "title",
+        "channel_ids",
+    )
 
     def __init__(self, data: types.Category, state: State) -> None:
         self._state = state
@@ -694,7 +757,7 @@ class Category(StateAware):
     def _update_from_data(self, data: types.Category):
         self.id = data["id"]
         self.title = data["title"]
-        self.channel_ids = data.get("channels", [])
+        self.channel_ids = tuple(data.get("channels", ()))
 
     def channels(self) -> List[ServerChannel]:
         """The list of channels in this category.
@@ -704,13 +767,7 @@ class Category(StateAware):
         List[:class:`ServerChannel`]
             The channels associated to this category.
         """
-        ret: List[ServerChannel] = []
-        cache = self._state.cache
-
-        for channel_id in self.channel_ids:
-            channel = cache.get_channel(channel_id)
-            if channel:
-                # Should always be a ServerChannel
-                ret.append(channel)  # type: ignore
+        get_channel = self._state.cache.get_channel
 
-        return ret
+        # Should always be a ServerChannel
+        return [c for cid in self.channel_ids if (c := get_channel(cid)) is not None]  # type: ignore
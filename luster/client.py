@@ -12,10 +12,8 @@ from typing import (
 )
 from typing_extensions import Self
 from luster.internal.events_handler import BE, EventsHandler, ListenersMixin, Listener
-from luster.http import create_http_handler, HTTPHandler
 from luster.internal.helpers import MISSING
 from luster.protocols import BaseModel
-from luster.websocket import WebsocketHandler
 from luster.cache import Cache
 from luster.state import State
 from luster.users import User
@@ -24,9 +22,13 @@ from luster.channels import ChannelT, channel_factory
 from luster.server import Server
 
 import asyncio
+import functools
+import sys
 
 if TYPE_CHECKING:
     from aiohttp import ClientSession
+    from luster.http import HTTPHandler
+    from luster.websocket import WebsocketHandler
     from luster.channels import DirectMessage, Group
     from luster import types
     from io import BufferedReader
@@ -59,12 +61,17 @@ class Client(ListenersMixin):
         be closed automatically after usage. Note that when a session
         is provided by the user, It must be closed by the user. Library
         will not take it's ownership.
-    http_handler_cls: Type[:class:`HTTPHandler`]
+
+        Passing the same session to multiple clients running in the same
+        event loop allows them to share the connection pool.
+    http_handler_cls: Optional[Type[:class:`HTTPHandler`]]
         The class type of :class:`HTTPHandler`. This can be used
-        to set custom subclasses on :attr:`.http_handler`.
-    websocket_handler_cls: Type[:class:`WebsocketHandler`]
+        to set custom subclasses on :attr:`.http_handler`. Defaults
+        to :class:`HTTPHandler`.
+    websocket_handler_cls: Optional[Type[:class:`WebsocketHandler`]]
         The class type of :class:`WebsocketHandler`. This can be used
-        to set custom subclasses on :attr:`.websocket_handler`.
+        to set custom subclasses on :attr:`.websocket_handler`. Defaults
+        to :class:`WebsocketHandler`.
     cache_cls: Type[:class:`Cache`]
         The class type of :class:`Cache`. This can be used
         to set custom subclasses on :attr:`.cache`.
@@ -81,10 +88,18 @@ class Client(ListenersMixin):
         token: str,
         bot: bool = True,
         session: Optional[ClientSession] = None,
-        http_handler_cls: Type[HTTPHandler] = HTTPHandler,
-        websocket_handler_cls: Type[WebsocketHandler] = WebsocketHandler,
+        http_handler_cls: Optional[Type[HTTPHandler]] = None,
+        websocket_handler_cls: Optional[Type[WebsocketHandler]] = None,
         cache_cls: Type[Cache] = Cache,
     ) -> None:
+        # Imported here so that importing the client does not load aiohttp
+        from luster.http import create_http_handler, HTTPHandler
+        from luster.websocket import WebsocketHandler
+
+        if http_handler_cls is None:
+            http_handler_cls = HTTPHandler
+        if websocket_handler_cls is None:
+            websocket_handler_cls = WebsocketHandler
 
         self.__http_handler = create_http_handler(token=token, bot=bot, cls=http_handler_cls, session=session)
         self.__websocket_handler = websocket_handler_cls(http_handler=self.__http_handler)
@@ -191,10 +206,11 @@ class Client(ListenersMixin):
         event: :class:`str`
             The event to listen to.
         """
-        def __wrap(func: Listener[BE]) -> Listener[BE]:
-            self.add_listener(event, func)
-            return func
-        return __wrap
+        return functools.partial(self._register_listener, event)
+
+    def _register_listener(self, event: str, func: Listener[BE]) -> Listener[BE]:
+        self.add_listener(event, func)
+        return func
 
     async def _async_init(self) -> None:
         if self.__initialized:
@@ -235,7 +251,11 @@ class Client(ListenersMixin):
 
         await self.__websocket_handler.connect()
 
-    def launch(self) -> None:
+    async def _runner(self) -> None:
+        async with self:
+            await self.connect()
+
+    def launch(self, *, use_uvloop: bool = True) -> None:
         """Launches the bot.
 
         This is a high level of :meth:`.connect` that handles asyncio
@@ -244,13 +264,37 @@ class Client(ListenersMixin):
 
         Consider using :meth:`.connect` if you intend to have more
         control over the event loop.
+
+        Parameters
+        ----------
+        use_uvloop: :class:`bool`
+            Whether to run the client in a `uvloop <https://github.com/MagicStack/uvloop>`_
+            event loop when it is installed. Defaults to ``True``.
         """
-        async def runner():
-            async with self:
-                await self.connect()
+        uvloop = None
+
+        if use_uvloop:
+            # Imported here so importing the client doesn't load uvloop
+            try:
+                import uvloop  # type: ignore[reportMissingImports]
+            except ImportError:
+                pass
 
         try:
-            asyncio.run(runner())
+            if sys.version_info >= (3, 11):
+                loop_factory = uvloop.new_event_loop if uvloop else None  # type: ignore
+                with asyncio.Runner(loop_factory=loop_factory) as asyncio_runner:
+                    asyncio_runner.run(self._runner())
+            else:
+                # asyncio.run() has no loop factory here so uvloop's policy
+                # is installed only for the duration of the run.
+                policy = asyncio.get_event_loop_policy()
+                if uvloop:
+                    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())  # type: ignore
+                try:
+                    asyncio.run(self._runner())
+                finally:
+                    asyncio.set_event_loop_policy(policy)
         except KeyboardInterrupt:
             pass
 
@@ -384,13 +428,8 @@ class Client(ListenersMixin):
             The fetching failed.
         """
         data = await self.__http_handler.fetch_direct_message_channels()
-        ret: List[Union[DirectMessage, Group]] = []
-
-        for item in data:
-            cls = channel_factory(item["channel_type"])
-            ret.append(cls(item, self.__state))  # type: ignore
-
-        return ret
+        state = self.__state
+        return [channel_factory(item["channel_type"])(item, state) for item in data]  # type: ignore
 
     # Servers
 
@@ -446,22 +485,18 @@ class Client(ListenersMixin):
             Creation of server failed.
         """
         json: types.CreateServerJSON = {
-            "name": name,
+            key: value  # type: ignore
+            for key, value in (("name", name), ("description", description), ("nsfw", nsfw))
+            if value is not MISSING
         }
 
-        if description is not MISSING:
-            json["description"] = description
-        if nsfw is not MISSING:
-            json["nsfw"] = nsfw
-
         data = await self.__http_handler.create_server(json=json)
 
-        server = Server(data["server"], self.__state)
-
-        for channel in data.get("channels", []):
-            cls = channel_factory(channel["channel_type"])
-            self.__cache.add_channel(cls(channel, self.__state))  # type: ignore
+        state = self.__state
+        server = Server(data["server"], state)
+        channels = data.get("channels", [])
 
+        self.__cache.bulk_add_channels(channel_factory(c["channel_type"])(c, state) for c in channels)  # type: ignore
         return server
 
     async def create_group(
@@ -494,19 +529,12 @@ class Client(ListenersMixin):
         HTTPException
             Creation of group failed.
         """
-        if recipients is MISSING:
-            recipients = []
-
+        users = [r.id for r in recipients] if recipients is not MISSING else []
         json: types.CreateGroupJSON = {
-            "name": name,
-            "users": [r.id for r in recipients],
+            key: value  # type: ignore
+            for key, value in (("name", name), ("users", users), ("description", description), ("nsfw", nsfw))
+            if value is not MISSING
         }
 
-        if description is not MISSING:
-            json["description"] = description
-
-        if nsfw is not MISSING:
-            json["nsfw"] = nsfw
-
         data = await self.__http_handler.create_group(json=json)
         return Group(data, self.__state)
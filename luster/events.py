@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional
-from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional
 from dataclasses import dataclass
 from luster.enums import WebsocketEvent
 
@@ -41,25 +40,32 @@ __all__ = (
 )
 
 
-class BaseEvent(ABC):
+class BaseEvent:
     """The base class for all classes relating to websocket events.
 
     Events classes are generally passed to event listeners callbacks
     and contain useful information about a certain websocket event.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
+    event_name: ClassVar[str]
+    """The name of this event."""
+
     def get_event_name(self) -> str:
         """Gets the name of event.
 
+        By default, this returns the :attr:`.event_name` class attribute.
+
         Returns
         -------
         :class:`str`
             The name of event.
         """
+        return self.event_name
 
 
-@dataclass
+@dataclass(eq=False)
 class Authenticated(BaseEvent):
     """An event emitted after authenticating the websocket session.
 
@@ -67,22 +73,23 @@ class Authenticated(BaseEvent):
     initiated the websocket session and is now ready for receiving data
     over websocket.
     """
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.AUTHENTICATED
 
+    __slots__ = ()
+    event_name = WebsocketEvent.AUTHENTICATED
 
-@dataclass
+
+@dataclass(eq=False)
 class Pong(BaseEvent):
     """An event emitted when client pings the websocket."""
 
+    __slots__ = ("data",)
+    event_name = WebsocketEvent.PONG
+
     data: Any
     """The data sent during the ping event."""
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.PONG
 
-
-@dataclass
+@dataclass(eq=False)
 class Ready(BaseEvent):
     """An event emitted when client is ready.
 
@@ -90,36 +97,36 @@ class Ready(BaseEvent):
     received from websocket initially.
     """
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.READY
+    __slots__ = ()
+    event_name = WebsocketEvent.READY
 
 
-@dataclass
+@dataclass(eq=False)
 class UserUpdate(BaseEvent):
     """An event emitted when ownself or another user is updated."""
 
+    __slots__ = ("before", "after")
+    event_name = WebsocketEvent.USER_UPDATE
+
     before: User
     """The user before the update."""
 
     after: User
     """The user after the update."""
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.USER_UPDATE
-
-@dataclass
+@dataclass(eq=False)
 class UserRelationship(BaseEvent):
     """An event emitted when your relationship with another user is updated."""
 
+    __slots__ = ("before", "after")
+    event_name = WebsocketEvent.USER_RELATIONSHIP
+
     before: Relationship
     """The relationship before the update."""
 
     after: Relationship
     """The relationship after the update."""
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.USER_RELATIONSHIP
-
     @property
     def user(self) -> User:
         """The user with which the relationship was updated."""
@@ -129,7 +136,7 @@ class UserRelationship(BaseEvent):
 UserRelationshipUpdate = UserRelationship
 """An alias for :class:`UserRelationship`."""
 
-@dataclass
+@dataclass(eq=False)
 class ServerCreate(BaseEvent):
     """An event emitted when a server is created.
 
@@ -139,81 +146,84 @@ class ServerCreate(BaseEvent):
     - The user creates a new server.
     """
 
+    __slots__ = ("server",)
+    event_name = WebsocketEvent.SERVER_CREATE
+
     server: Server
     """The new server."""
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.SERVER_CREATE
 
-
-@dataclass
+@dataclass(eq=False)
 class ServerUpdate(BaseEvent):
     """An event emitted when a server is updated."""
 
+    __slots__ = ("before", "after")
+    event_name = WebsocketEvent.SERVER_UPDATE
+
     before: Server
     """The server before the update."""
 
     after: Server
     """The server after the update."""
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.SERVER_UPDATE
 
-
-@dataclass
+@dataclass(eq=False)
 class ServerDelete(BaseEvent):
     """An event emitted when a server is deleted."""
 
+    __slots__ = ("server", "channels")
+    event_name = WebsocketEvent.SERVER_DELETE
+
     server: Server
     """The deleted server."""
 
     channels: List[ServerChannel]
     """The list of channels belonging to the server that was deleted."""
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.SERVER_DELETE
 
-
-@dataclass
+@dataclass(eq=False)
 class ChannelCreate(BaseEvent):
     """An event emitted when a channel is created."""
 
+    __slots__ = ("channel",)
+    event_name = WebsocketEvent.CHANNEL_CREATE
+
     channel: ChannelT
     """The new channel."""
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.CHANNEL_CREATE
 
-
-@dataclass
+@dataclass(eq=False)
 class ChannelUpdate(BaseEvent):
     """An event emitted when a channel is updated."""
 
+    __slots__ = ("before", "after")
+    event_name = WebsocketEvent.CHANNEL_UPDATE
+
     before: ChannelT
     """The channel before the update."""
 
     after: ChannelT
     """The channel after the update."""
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.CHANNEL_UPDATE
 
-
-@dataclass
+@dataclass(eq=False)
 class ChannelDelete(BaseEvent):
     """An event emitted when a channel is deleted."""
 
+    __slots__ = ("channel",)
+    event_name = WebsocketEvent.CHANNEL_DELETE
+
     channel: ChannelT
     """The deleted channel."""
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.CHANNEL_DELETE
 
-
-@dataclass
+@dataclass(eq=False)
 class ChannelGroupJoin(BaseEvent):
     """An event emitted when a user joins a group."""
 
+    __slots__ = ("channel", "user", "user_id")
+    event_name = WebsocketEvent.CHANNEL_GROUP_JOIN
+
     channel: Group
     """The joined group."""
 
@@ -238,14 +248,14 @@ class ChannelGroupJoin(BaseEvent):
         """
         return self.channel
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.CHANNEL_GROUP_JOIN
 
-
-@dataclass
+@dataclass(eq=False)
 class ChannelGroupLeave(BaseEvent):
     """An event emitted when a user leaves a group."""
 
+    __slots__ = ("channel", "user", "user_id")
+    event_name = WebsocketEvent.CHANNEL_GROUP_LEAVE
+
     channel: Group
     """The left group."""
 
@@ -270,9 +280,6 @@ class ChannelGroupLeave(BaseEvent):
         """
         return self.channel
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.CHANNEL_GROUP_LEAVE
-
 
 GroupJoin = ChannelGroupJoin
 """An alias for :class:`ChannelGroupJoin`."""
@@ -281,7 +288,7 @@ GroupLeave = ChannelGroupLeave
 """An alias for :class:`ChannelGroupLeave`."""
 
 
-@dataclass
+@dataclass(eq=False)
 class ServerRoleCreate(BaseEvent):
     """An event emitted when a server role is created.
     
@@ -296,24 +303,27 @@ class ServerRoleCreate(BaseEvent):
         state, this may cause false positive dispatches. 
     """
 
+    __slots__ = ("server", "role")
+    event_name = WebsocketEvent.SERVER_ROLE_CREATE
+
     server: Server
     """The server that the role belongs to."""
 
     role: Role
     """The created role."""
 
-    def get_event_name(self) -> str:
-        return WebsocketEvent.SERVER_ROLE_CREATE
-
 
 RoleCreate = ServerRoleCreate
 """An alias for :class:`ServerRoleCreate`."""
 
 
-@dataclass
+@dataclass(eq=False)
 class ServerRoleUpdate(BaseEvent):
     """An event emitted when a server role is updated."""
 
+    __slots__ = ("server", "before", "after")
+    event_name = WebsocketEvent.SERVER_ROLE_UPDATE
+
     server: Server
     """The server that the role belongs to."""
 
@@ -323,27 +333,24 @@ class ServerRoleUpdate(BaseEvent):
     after: Role
     """The updated role."""
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.SERVER_ROLE_UPDATE
-
 
 RoleUpdate = ServerRoleUpdate
 """An alias of :class:`ServerRoleUpdate`."""
 
 
-@dataclass
+@dataclass(eq=False)
 class ServerRoleDelete(BaseEvent):
     """An event emitted when a server role is delete."""
 
+    __slots__ = ("server", "role")
+    event_name = WebsocketEvent.SERVER_ROLE_DELETE
+
     server: Server
     """The server that the role belongs to."""
 
     role: Role
     """The role that was deleted."""
 
-    def get_event_name(self) -> types.EventTypeRecv:
-        return WebsocketEvent.SERVER_ROLE_DELETE
-
 
 RoleDelete = ServerRoleDelete
 """An alias of :class:`ServerRoleUpdate`."""
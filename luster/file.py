@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
-from luster.internal.helpers import handle_optional_field
 from luster.internal.mixins import StateAware
 
 if TYPE_CHECKING:
@@ -36,7 +35,6 @@ class PartialUploadedFile(StateAware):
         id: str
 
     __slots__ = (
-        "_state",
         "tag",
         "id",
     )
@@ -102,12 +100,12 @@ class File(StateAware):
         object_id: Optional[str]
 
     __slots__ = (
-        "_state",
         "id",
         "tag",
         "filename",
         "content_type",
         "size",
+        "type",
         "deleted",
         "reported",
         "message_id",
@@ -129,8 +127,9 @@ class File(StateAware):
         self.filename = data["filename"]
         self.content_type = data["content_type"]
         self.size = data["size"]
-        self.deleted = handle_optional_field(data, "deleted", False, None)
-        self.reported = handle_optional_field(data, "reported", False, None)
+        # These may be missing or explicitly null
+        self.deleted = data.get("deleted") or False
+        self.reported = data.get("reported") or False
         self.message_id = data.get("message_id")
         self.user_id = data.get("user_id")
         self.server_id = data.get("server_id")
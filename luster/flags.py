@@ -12,7 +12,6 @@ from typing import (
     TypeVar,
     overload,
 )
-import inspect
 
 __all__ = ()
 
@@ -39,10 +38,16 @@ class _FlagProxy:
         if instance is None:
             return self.value
 
-        return instance.get(self.flag)
+        # The bit is already known here, no need to go through get()/set()
+        return (instance.value & self.value) > 0
 
     def __set__(self, instance: BaseFlags, mode: bool) -> None:
-        instance.set(self.flag, mode)
+        if mode is True:
+            instance.value |= self.value
+        elif mode is False:
+            instance.value &= ~self.value
+        else:
+            raise TypeError("Expected the flag value to be a bool, got %r" % mode.__class__)
 
 
 class BaseFlags:
@@ -56,18 +61,19 @@ class BaseFlags:
             self.set(flag, mode)
 
     def get(self, flag: str) -> bool:
-        flags = self.__valid_flags__
-        if not flag in flags:
-            raise ValueError("Invalid flag %r" % flag)
+        try:
+            flag_value = self.__valid_flags__[flag]
+        except KeyError:
+            raise ValueError("Invalid flag %r" % flag) from None
 
-        flag_value = flags[flag]
         return (self.value & flag_value) > 0
 
     def set(self, flag: str, mode: bool) -> None:
-        if not flag in self.__valid_flags__:
-            raise ValueError("Invalid flag %r" % flag)
+        try:
+            flag_value = self.__valid_flags__[flag]
+        except KeyError:
+            raise ValueError("Invalid flag %r" % flag) from None
 
-        flag_value = self.__valid_flags__[flag]
         if mode is True:
             self.value |= flag_value
         elif mode is False:
@@ -76,7 +82,12 @@ class BaseFlags:
             raise TypeError("Expected the flag value to be a bool, got %r" % mode.__class__)
 
     def __init_subclass__(cls) -> None:
-        for name, member in inspect.getmembers(cls):
+        # Each subclass gets its own copy so flags don't leak into siblings.
+        cls.__valid_flags__ = cls.__valid_flags__.copy()
+
+        # Only the class body needs to be scanned, inherited flags have
+        # already been replaced by proxies on the parent class.
+        for name, member in list(vars(cls).items()):
             if isinstance(member, int) and not name.startswith("_"):
                 cls.__valid_flags__[name] = member
                 setattr(cls, name, _FlagProxy(name, member))
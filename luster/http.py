@@ -5,8 +5,8 @@ from __future__ import annotations
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     ClassVar,
-    Coroutine,
     Dict,
     Generator,
     Literal,
@@ -16,7 +16,9 @@ from typing import (
     overload,
 )
 from typing_extensions import Self
+from multidict import istr
 from luster.internal.mixins import StateManagementMixin
+from luster.internal.serialization import dumps, loads
 from luster.exceptions import (
     HTTPException,
     HTTPForbidden,
@@ -24,6 +26,7 @@ from luster.exceptions import (
     HTTPServerError,
 )
 
+import asyncio
 import io
 import aiohttp
 import luster
@@ -45,6 +48,25 @@ STATUS_CODE_EXCEPTIONS: Dict[int, Type[HTTPException]] = {
     404: HTTPNotFound,
 }
 
+# aiohttp stores headers in a case-insensitive multidict; istr keys are
+# already in the form it needs so they aren't case-folded on every request.
+_BOT_TOKEN_HEADER = istr("X-Bot-Token")
+_SESSION_TOKEN_HEADER = istr("X-Session-Token")
+
+_UPLOAD_CHUNK_SIZE = 65536
+
+
+async def _read_chunks(file: io.BufferedReader) -> AsyncIterator[bytes]:
+    # aiohttp closes file objects it is given once the request is sent;
+    # reading through a generator streams the file without taking
+    # ownership of it.
+    loop = asyncio.get_running_loop()
+    while True:
+        chunk = await loop.run_in_executor(None, file.read, _UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
 
 @overload
 def create_http_handler(
@@ -158,7 +180,8 @@ class HTTPHandler(StateManagementMixin):
     """The user agent for attaching to requests.
 
     This by default includes library name but could be modified
-    to be different.
+    to be different. Modifications only apply to handlers created
+    after the change.
 
     .. danger::
 
@@ -185,6 +208,10 @@ class HTTPHandler(StateManagementMixin):
         self.__session: Optional[aiohttp.ClientSession] = session
         self._session_owner: bool = session is None
         self._bot: bool = bot
+        self._auth_headers: Dict[str, str] = {
+            aiohttp.hdrs.USER_AGENT: self.USER_AGENT,
+            _BOT_TOKEN_HEADER if bot else _SESSION_TOKEN_HEADER: token,
+        }
 
     async def __aenter__(self) -> Self:
         await self._async_init()
@@ -250,9 +277,16 @@ class HTTPHandler(StateManagementMixin):
 
         return session.closed
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        # Requests only go to a couple of hosts so DNS results and idle
+        # connections are kept around longer than aiohttp defaults to avoid
+        # repeating lookups and TLS handshakes between bursts of requests.
+        connector = aiohttp.TCPConnector(ttl_dns_cache=300, keepalive_timeout=75)
+        return aiohttp.ClientSession(connector=connector, json_serialize=dumps)
+
     async def _async_init(self) -> Self:
         if self.closed:
-            self.__session = aiohttp.ClientSession()
+            self.__session = self._create_session()
             self._session_owner = True
 
         return self
@@ -271,10 +305,12 @@ class HTTPHandler(StateManagementMixin):
 
         return False
 
-    def _get_response(self, response: aiohttp.ClientResponse) -> Coroutine[Any, Any, Any]:
+    async def _get_response(self, response: aiohttp.ClientResponse) -> Any:
         if response.content_type == "application/json":
-            return response.json()
-        return response.text()
+            # The JSON parsers accept bytes so decoding to str is skipped
+            body = await response.read()
+            return loads(body) if body else None
+        return await response.text()
 
     async def request(self, method: str, route: str, base_url: Optional[str] = None, **kwargs: Any) -> Any:
         """Requests a certain route and returns the response data.
@@ -302,12 +338,11 @@ class HTTPHandler(StateManagementMixin):
             raise RuntimeError("HTTP handler is closed.")
 
         # Headers construction
-        headers = kwargs.pop("headers", {})
-        to_update = {
-            "User-Agent": self.USER_AGENT,
-            "X-Bot-Token" if self._bot else "X-Session-Token": self.__token,
-        }
-        headers.update(to_update)
+        headers = kwargs.pop("headers", None)
+        if headers is None:
+            headers = self._auth_headers
+        else:
+            headers.update(self._auth_headers)
 
         if base_url is None:
             base_url = self.BASE_URL
@@ -322,17 +357,14 @@ class HTTPHandler(StateManagementMixin):
 
             data = await self._get_response(response)
 
-            if status < 300 and status >= 200:
+            if 200 <= status < 300:
                 return data
 
-            if status in STATUS_CODE_EXCEPTIONS:
-                exc = STATUS_CODE_EXCEPTIONS[status](response, data)
-                raise exc
-
-            if status >= 500:
-                raise HTTPServerError(response, data)
+            exc_cls = STATUS_CODE_EXCEPTIONS.get(status)
+            if exc_cls is None:
+                exc_cls = HTTPServerError if status >= 500 else HTTPException
 
-            raise HTTPException(response, data)
+            raise exc_cls(response, data)
 
     async def upload_file(self, file: io.BufferedReader, tag: types.FileTag) -> types.UploadFileResponse:
         """Uploads a file to Autumn file server.
@@ -352,10 +384,12 @@ class HTTPHandler(StateManagementMixin):
         if not file.readable():
             raise RuntimeError("Asset must be readable")
 
+        # The file is streamed in chunks rather than loaded in memory
+        # and is left open for the caller.
         data = aiohttp.FormData()
         data.add_field(
             name="file",
-            value=file.read(),
+            value=_read_chunks(file),
             filename=file.name,
             content_type="application/octet-stream",
         )
@@ -7,6 +7,7 @@ from typing import (
     Callable,
     Dict,
     List,
+    Set,
     Tuple,
     TypeVar,
     TYPE_CHECKING,
@@ -24,6 +25,7 @@ import asyncio
 import copy
 import inspect
 import logging
+import sys
 import traceback
 
 
@@ -41,6 +43,19 @@ Handler = Callable[["EventsHandler", Any], Any]
 
 _LOGGER = logging.getLogger(__name__)
 
+# Events that carry no data are dispatched as shared instances
+_AUTHENTICATED_EVENT = events.Authenticated()
+_READY_EVENT = events.Ready()
+
+if sys.version_info >= (3, 12):
+    # Listeners often finish without ever suspending, starting them eagerly
+    # runs them right away instead of in a later event loop iteration.
+    def _create_listener_task(loop: asyncio.AbstractEventLoop, coro: Any) -> asyncio.Task[Any]:
+        return asyncio.Task(coro, loop=loop, eager_start=True)  # type: ignore
+else:
+    def _create_listener_task(loop: asyncio.AbstractEventLoop, coro: Any) -> asyncio.Task[Any]:
+        return loop.create_task(coro)
+
 
 class ListenersMixin(ABC):
     @abstractmethod
@@ -97,13 +112,10 @@ class ListenersMixin(ABC):
         if not asyncio.iscoroutinefunction(callback):
             raise TypeError("Listener callback must be a coroutine.")
 
+        # Event names built at runtime are interned so that dispatch
+        # lookups with the interned class level names match by identity.
         handler = self._get_events_handler()
-        listeners = handler.listeners
-
-        if event in listeners:
-            listeners[event].append(callback)
-        else:
-            listeners[event] = [callback]
+        handler.listeners.setdefault(sys.intern(event), []).append(callback)
 
     def clear_listeners(self, event: str) -> List[Listener[Any]]:
         """Removes all the listeners for the given websocket event.
@@ -172,7 +184,9 @@ class ListenersMixin(ABC):
         invoked event.
 
         Note that the listeners are ran as asyncio tasks in
-        an unspecified order.
+        an unspecified order. On Python 3.12 and above, these tasks
+        are started eagerly i.e each listener runs until it first
+        suspends before this method returns.
 
         Parameters
         ----------
@@ -185,13 +199,25 @@ class ListenersMixin(ABC):
             No event loop is running.
         """
         handler = self._get_events_handler()
-        name = data.get_event_name()
+        listeners = handler.listeners.get(data.get_event_name())
+
+        # Most events have no listeners at all
+        if not listeners:
+            return
 
-        listeners = handler.listeners.get(name, [])
         loop = asyncio.get_running_loop()
+        call_listener = self.__call_listener
+
+        # The event loop only keeps weak references to tasks
+        tasks = handler._listener_tasks
 
         for listener in listeners:
-            loop.create_task(self.__call_listener(listener, data))
+            task = _create_listener_task(loop, call_listener(listener, data))
+
+            # Eagerly started listeners may have finished already
+            if not task.done():
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
 
 
 def event_handler(event: EventTypeRecv) -> Callable[[Handler], Handler]:
@@ -203,33 +229,44 @@ def event_handler(event: EventTypeRecv) -> Callable[[Handler], Handler]:
     return __wrap
 
 
+def _collect_event_handlers(cls: type) -> Dict[EventTypeRecv, Handler]:
+    handlers: Dict[EventTypeRecv, Handler] = {}
+
+    for _, member in inspect.getmembers(cls):
+        if hasattr(member, "__luster_event_handler__"):
+            handlers[member.__luster_event_handler__] = member  # type: ignore[reportUnknownMemberAccess]
+
+    return handlers
+
+
 class EventsHandler(ListenersMixin):
+    # Collected once per class rather than on every initialization
+    __event_handlers__: Dict[EventTypeRecv, Handler]
+
     def __init__(self, state: State) -> None:
         self._state = state
-        self.__handlers: Dict[EventTypeRecv, Handler] = {}
         self.listeners: Dict[str, List[Listener[Any]]] = {}
+        self._listener_tasks: Set[asyncio.Task[None]] = set()
 
-        for _, member in inspect.getmembers(self):
-            if hasattr(member, "__luster_event_handler__"):
-                self.__handlers[member.__luster_event_handler__] = member  # type: ignore[reportUnknownMemberAccess]
+    def __init_subclass__(cls) -> None:
+        cls.__event_handlers__ = _collect_event_handlers(cls)
 
     def _get_events_handler(self) -> EventsHandler:
         return self
 
     async def call_handler(self, event: EventTypeRecv, data: Dict[str, Any]) -> None:
         try:
-            handler = self.__handlers[event]
+            handler = self.__event_handlers__[event]
         except KeyError:
             _LOGGER.debug("No handler available for websocket event %r", event)
         else:
-            await handler(data)  # type: ignore
+            await handler(self, data)  # type: ignore
 
     @event_handler("Authenticated")
     async def on_authenticated(self, data: types.AuthenticatedEvent) -> None:
         _LOGGER.info("Successfully connected and logged in to Revolt.")
 
-        event = events.Authenticated()
-        self.call_listeners(event)
+        self.call_listeners(_AUTHENTICATED_EVENT)
 
     @event_handler("Pong")
     async def on_pong(self, data: types.PongEvent) -> None:
@@ -253,25 +290,25 @@ class EventsHandler(ListenersMixin):
         _LOGGER.info("Preparing client cache. (%r users, %r servers, %r channels)",
                      len(users), len(servers), len(channels))
 
+        cache = state.cache
+        cached_users: List[User] = []
+
         for user in users:
             obj = User(user, state)
-            state.cache.add_user(obj)
+            cached_users.append(obj)
 
             if obj.relationship == RelationshipStatus.USER:
                 self._state.user = obj
 
-        for channel in channels:
-            cls = channel_factory(channel["channel_type"])
-            # Type checker fails to resolve signature of cls
-            state.cache.add_channel(cls(channel, state))  # type: ignore
+        cache.bulk_add_users(cached_users)
 
-        for server in servers:
-            state.cache.add_server(Server(server, state))
+        # Type checker fails to resolve signature of channel_factory() return type
+        cache.bulk_add_channels(channel_factory(c["channel_type"])(c, state) for c in channels)  # type: ignore
+        cache.bulk_add_servers(Server(s, state) for s in servers)
 
         _LOGGER.info("Successfully cached the entities.")
 
-        event = events.Ready()
-        self.call_listeners(event)
+        self.call_listeners(_READY_EVENT)
 
     @event_handler("UserUpdate")
     async def on_user_update(self, data: types.UserUpdateEvent) -> None:
@@ -323,9 +360,8 @@ class EventsHandler(ListenersMixin):
 
         server = Server(data["server"], self._state)
 
-        for payload in data.get("channels", []):
-            cls = channel_factory(payload["channel_type"])
-            cache.add_channel(cls(payload, state))  # type: ignore
+        channels = data.get("channels", [])
+        cache.bulk_add_channels(channel_factory(p["channel_type"])(p, state) for p in channels)  # type: ignore
 
         event = events.ServerCreate(server=server)
 
@@ -501,3 +537,6 @@ class EventsHandler(ListenersMixin):
             role=role,
         )
         self.call_listeners(event)
+
+
+EventsHandler.__event_handlers__ = _collect_event_handlers(EventsHandler)
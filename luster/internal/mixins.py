@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 class StateAware:
     _state: State
 
+    __slots__ = ("_state",)
+
     @property
     def state(self) -> State:
         return self._state
@@ -19,6 +21,8 @@ class StateAware:
 class StateManagementMixin:
     _state: Optional[State]
 
+    __slots__ = ("_state",)
+
     @property
     def state(self) -> Optional[State]:
         """Returns the state attached to this class.
@@ -0,0 +1,29 @@
+# Copyright (C) I. Ahmad (nerdguyahmad) 2022-2023
+
+from __future__ import annotations
+
+from typing import Any
+
+__all__ = (
+    "dumps",
+    "loads",
+)
+
+try:
+    import orjson  # type: ignore[reportMissingImports]
+except ImportError:
+    try:
+        import ujson as _json  # type: ignore
+    except ImportError:
+        import json as _json
+
+    def dumps(obj: Any) -> str:
+        return _json.dumps(obj)
+
+    loads = _json.loads
+else:
+    def dumps(obj: Any) -> str:
+        # orjson returns bytes while aiohttp's serializer must return str
+        return orjson.dumps(obj).decode("utf-8")
+
+    loads = orjson.loads
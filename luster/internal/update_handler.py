@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Generic, TypeVar, TypedDict
+from typing import Any, Callable, ClassVar, Dict, Generic, Optional, Tuple, TypeVar, TypedDict
 import inspect
 
 DataT = TypeVar("DataT", bound=TypedDict)
 Handler = Callable[[Any, Any], Any]
+UpdateMap = Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]]
 
 def handle_update(field: str) -> Callable[[Handler], Handler]:
     def __wrap(func: Handler) -> Handler:
@@ -19,6 +20,12 @@ def handle_update(field: str) -> Callable[[Handler], Handler]:
 class UpdateHandler(Generic[DataT]):
     __update_handlers__: Dict[str, Handler]
 
+    __slots__ = ()
+
+    # Fields that only need to be assigned (optionally through a converter)
+    # map to (attribute, converter) here instead of a handle_update() method.
+    _UPDATE_MAP: ClassVar[UpdateMap] = {}
+
     def __init_subclass__(cls) -> None:
         cls.__update_handlers__ = handlers = {}
 
@@ -32,8 +39,16 @@ class UpdateHandler(Generic[DataT]):
 
     def update(self, data: DataT) -> None:
         handlers = self.__update_handlers__
+        fields = self._UPDATE_MAP
 
         for field, value in data.items():
+            target = fields.get(field)
+
+            if target is not None:
+                attr, converter = target
+                setattr(self, attr, value if converter is None else converter(value))
+                continue
+
             try:
                 handler = handlers[field]
             except KeyError:
@@ -11,6 +11,8 @@ from luster.internal.update_handler import UpdateHandler, handle_update
 from luster.flags import BaseFlags
 from luster import types
 
+import functools
+
 if TYPE_CHECKING:
     from luster.state import State
 
@@ -290,6 +292,31 @@ class PermissionOverwrite:
 
         return overwrite
 
+    def _copy(self) -> Self:
+        overwrite = self.__class__()
+        overwrite._overrides = self._overrides.copy()
+        return overwrite
+
+    @classmethod
+    def _from_bits(cls, allow: int, deny: int) -> Self:
+        overwrite = cls()
+        overwrite._overrides = _overrides_from_bits(allow, deny).copy()
+        return overwrite
+
+
+# Only a handful of distinct allow/deny bitmask pairs exist across a server's
+# overwrites so the flag resolution done by from_pair() is computed once per
+# pair. Both the Permissions and the resolved overrides are mutable, which is
+# why they never leave this module and _from_bits() hands out copies.
+@functools.lru_cache(maxsize=256)
+def _permissions(value: int) -> Permissions:
+    return Permissions(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _overrides_from_bits(allow: int, deny: int) -> Dict[str, Optional[bool]]:
+    return PermissionOverwrite.from_pair(_permissions(allow), _permissions(deny))._overrides
+
 
 class Role(StateAware, UpdateHandler[types.ServerRoleUpdateEventData]):
     """Represents a server role.
@@ -313,7 +340,6 @@ class Role(StateAware, UpdateHandler[types.ServerRoleUpdateEventData]):
         "colour",
         "hoist",
         "rank",
-        "_state",
         "_permissions",
     )
 
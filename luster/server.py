@@ -85,7 +85,6 @@ class Server(StateAware, UpdateHandler[ServerUpdateEventData]):
         _roles: Dict[str, Role]
 
     __slots__ = (
-        "_state",
         "id",
         "owner_id",
         "name",
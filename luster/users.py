@@ -14,7 +14,6 @@ from luster.internal.mixins import StateAware
 from luster.internal.update_handler import UpdateHandler, handle_update
 from luster.types.websocket import UserUpdateEventData
 from luster.file import File
-from luster.http import HTTPHandler
 from luster.enums import RelationshipStatus, PresenceType
 
 if TYPE_CHECKING:
@@ -51,7 +50,6 @@ class Relationship(StateAware):
         status: types.RelationshipStatus
 
     __slots__ = (
-        "_state",
         "user",
         "id",
         "status",
@@ -87,7 +85,6 @@ class Profile(StateAware):
         background: Optional[File]
 
     __slots__ = (
-        "_state",
         "user",
         "content",
         "background",
@@ -127,7 +124,6 @@ class Status(StateAware):
         presence: types.PresenceType
 
     __slots__ = (
-        "_state",
         "user",
         "text",
         "presence",
@@ -163,7 +159,6 @@ class PartialUserBot(StateAware):
         owner_id: str
 
     __slots__ = (
-        "_state",
         "user",
         "owner_id",
     )
@@ -223,7 +218,6 @@ class User(StateAware, UpdateHandler[UserUpdateEventData]):
         status: Optional[Status]
 
     __slots__ = (
-        "_state",
         "id",
         "username",
         "avatar",
@@ -236,6 +230,8 @@ class User(StateAware, UpdateHandler[UserUpdateEventData]):
         "profile",
         "status",
         "bot",
+        # Cache keeps a weak username index of users
+        "__weakref__",
     )
 
     def __init__(self, data: types.User, state: State) -> None:
@@ -322,6 +318,8 @@ class User(StateAware, UpdateHandler[UserUpdateEventData]):
         -------
         :class:`str`
         """
+        from luster.http import HTTPHandler
+
         return f"{HTTPHandler.BASE_URL}/users/{self.id}/default_avatar"
 
     @property
@@ -9,6 +9,7 @@ from typing import (
     Optional,
 )
 from luster.internal.mixins import StateManagementMixin
+from luster.internal.serialization import dumps, loads
 from luster.http import HTTPHandler
 
 import asyncio
@@ -23,6 +24,10 @@ if TYPE_CHECKING:
     from luster.types.websocket import BaseWebsocketEvent
     from luster import types
 
+__all__ = (
+    "WebsocketHandler",
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 try:
@@ -32,11 +37,6 @@ except ImportError:
 else:
     _HAS_MSGPACK = True
 
-try:
-    import ujson as json  # type: ignore
-except ImportError:
-    import json
-
 
 class WebsocketHandler(StateManagementMixin):
     """A class that handles websocket connection with Revolt Events API.
@@ -175,8 +175,8 @@ class WebsocketHandler(StateManagementMixin):
 
         if isinstance(data, str):
             try:
-                loaded = json.loads(data)
-            except json.JSONDecodeError:
+                loaded = loads(data)
+            except ValueError:
                 raise RuntimeError("Received malformed JSON websocket packet")
             else:
                 return loaded
@@ -185,11 +185,20 @@ class WebsocketHandler(StateManagementMixin):
 
     async def __handle_recv(self) -> None:
         data = await self.__recv()
+        await self.__dispatch(data)
+
+    async def __dispatch(self, data: BaseWebsocketEvent) -> None:
         type = data["type"]
 
         asyncio.create_task(self.__call_recv_hook(type, data))  # type: ignore
         _LOGGER.debug("Received the %r websocket event", type)
 
+        if type == "Bulk":
+            # Inner events are handled exactly like the top level ones
+            for inner in data["v"]:  # type: ignore
+                await self.__dispatch(inner)
+            return
+
         if type == "Authenticated":
             self.__ping_task = asyncio.create_task(self.__ping_task_impl(), name="luster:ping-task")
 
@@ -291,7 +300,7 @@ class WebsocketHandler(StateManagementMixin):
         if _HAS_MSGPACK:
             await websocket.send_bytes(msgpack.packb(data))  # type: ignore
         else:
-            await websocket.send_json(data)
+            await websocket.send_json(data, dumps=dumps)
 
     async def on_websocket_event(self, type: types.EventTypeRecv, data: Dict[str, Any]) -> Any:
         """A hook that gets called whenever a websocket event is received.
@@ -299,6 +308,9 @@ class WebsocketHandler(StateManagementMixin):
         By default, this does nothing. The subclasses can override this
         method to implement custom behaviour.
 
+        For ``Bulk`` events, this is called for the bulk event itself
+        and then for each of the events inside it.
+
         Parameters
         ----------
         type: :class:`types.EventTypeRecv`
@@ -27,6 +27,7 @@ EXTRA_REQUIREMENTS = {
         'aiodns>=1.1',
         'cchardet',
         'Brotli',
+        'uvloop; sys_platform != "win32"',
     ],
 }
 
@@ -0,0 +1,166 @@
+import unittest
+
+from luster.cache import Cache
+from luster.object import Object
+
+
+class _CountingDict(dict):
+    def __init__(self) -> None:
+        super().__init__()
+        self.operations = 0
+
+    def __setitem__(self, key, value) -> None:
+        self.operations += 1
+        super().__setitem__(key, value)
+
+    def __getitem__(self, key):
+        self.operations += 1
+        return super().__getitem__(key)
+
+    def __contains__(self, key) -> bool:
+        self.operations += 1
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        self.operations += 1
+        return super().get(key, default)
+
+    def pop(self, key, *default):
+        self.operations += 1
+        return super().pop(key, *default)
+
+
+class _User(Object):
+    __slots__ = ("username", "__weakref__")
+
+    def __init__(self, id: str, username: str = "luster") -> None:
+        super().__init__(id)
+        self.username = username
+
+
+class TestCache(unittest.TestCase):
+    def test_single_bucket_operation(self) -> None:
+        cache = Cache()
+        cache._users = users = _CountingDict()
+        user = _User("01FZ8Y2ZCJ1G8QF6PZ8RN8GN2V")
+
+        # Upserts read the replaced entity and write the new one
+        assert cache.add_user(user) is None  # type: ignore
+        assert users.operations == 2
+
+        assert cache.get_user(user.id) is user
+        assert users.operations == 3
+
+        assert cache.remove_user(user.id) is user
+        assert users.operations == 4
+
+        assert cache.get_user(user.id) is None
+        assert cache.remove_user(user.id) is None
+        assert users.operations == 6
+
+        replacement = _User(user.id)
+        cache.add_user(user)  # type: ignore
+        assert cache.add_user(replacement) is user  # type: ignore
+
+    def test_clear_keeps_views(self) -> None:
+        cache = Cache()
+        users = cache.users()
+
+        cache.add_user(_User("01FZ8Y2ZCJ1G8QF6PZ8RN8GN2V"))  # type: ignore
+        assert len(users) == 1
+
+        cache.clear()
+        assert len(users) == 0
+
+        cache.add_user(_User("01FZ8Y2ZCJ1G8QF6PZ8RN8GN2W"))  # type: ignore
+        assert len(users) == 1
+
+    def test_bulk_add(self) -> None:
+        cache = Cache()
+        channels = [Object("01FZ8Y2ZCJ1G8QF6PZ8RN8GN2%s" % c) for c in "ABC"]
+
+        cache.bulk_add_channels(channels)  # type: ignore
+        assert cache.snapshot_channels() == channels
+
+        for channel in channels:
+            assert cache.get_channel(channel.id) is channel
+
+    def test_bounded_bucket(self) -> None:
+        cache = Cache(max_users=2)
+        a, b, c = (_User("01FZ8Y2ZCJ1G8QF6PZ8RN8GN2%s" % c, c) for c in "ABC")
+
+        cache.add_user(a)  # type: ignore
+        cache.add_user(b)  # type: ignore
+
+        # Accessing 'a' makes 'b' the least recently used user
+        assert cache.get_user(a.id) is a
+        cache.add_user(c)  # type: ignore
+
+        assert cache.get_user(b.id) is None
+        assert cache.snapshot_users() == [a, c]
+
+        cache.bulk_add_users([b])  # type: ignore
+        assert cache.snapshot_users() == [c, b]
+
+        self.assertRaises(ValueError, Cache, max_channels=0)
+
+    def test_get_user_by_name(self) -> None:
+        cache = Cache()
+        user = _User("01FZ8Y2ZCJ1G8QF6PZ8RN8GN2A", "foo")
+
+        cache.add_user(user)  # type: ignore
+        assert cache.get_user_by_name("foo") is user
+
+        user.username = "bar"
+        assert cache.get_user_by_name("foo") is None
+
+        cache.remove_user(user.id)
+        assert cache.get_user_by_name("bar") is None
+
+    def test_get_user_by_name_after_rename(self) -> None:
+        cache = Cache()
+        user = _User("01FZ8Y2ZCJ1G8QF6PZ8RN8GN2A", "foo")
+
+        cache.add_user(user)  # type: ignore
+        assert cache.get_user_by_name("foo") is user
+
+        user.username = "bar"
+        assert cache.get_user_by_name("foo") is None
+        assert cache.get_user_by_name("bar") is user
+        assert cache.get_user_by_name("bar") is user
+
+    def test_user_index_built_lazily(self) -> None:
+        cache = Cache()
+        a = _User("01FZ8Y2ZCJ1G8QF6PZ8RN8GN2A", "foo")
+        b = _User("01FZ8Y2ZCJ1G8QF6PZ8RN8GN2B", "bar")
+
+        cache.add_user(a)  # type: ignore
+        assert cache._users_by_name is None
+
+        # Users added before the first lookup are indexed too
+        assert cache.get_user_by_name("foo") is a
+
+        cache.bulk_add_users([b])  # type: ignore
+        assert cache.get_user_by_name("bar") is b
+
+    def test_bulk_add_uses_overrides(self) -> None:
+        class _Cache(Cache):
+            def __init__(self) -> None:
+                super().__init__()
+                self.user_store = {}
+
+            def add_user(self, user):
+                previous = self.user_store.get(user.id)
+                self.user_store[user.id] = user
+                return previous
+
+        cache = _Cache()
+        user = _User("01FZ8Y2ZCJ1G8QF6PZ8RN8GN2A")
+
+        cache.bulk_add_users([user])  # type: ignore
+        assert cache.user_store == {user.id: user}
+        assert cache.snapshot_users() == []
+
+
+if __name__ == "__main__":
+    unittest.main()
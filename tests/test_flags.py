@@ -25,6 +25,20 @@ class TestInternalHelpers(unittest.TestCase):
         assert flags.bar
         assert flags.value == (Example.foo | Example.bar)
 
+    def test_flags_not_shared(self) -> None:
+        class Other(BaseFlags):
+            qux = 1 << 0
+
+        class Derived(Example):
+            qux = 1 << 3
+
+        assert list(Other.__valid_flags__) == ["qux"]
+        assert list(Example.__valid_flags__) == ["foo", "bar", "baz"]
+        assert list(Derived.__valid_flags__) == ["foo", "bar", "baz", "qux"]
+
+        with self.assertRaises(ValueError):
+            Example().get("qux")
+
 
 if __name__ == "__main__":
     unittest.main()
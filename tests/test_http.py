@@ -0,0 +1,46 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from luster.http import HTTPHandler
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    async def write(self, data: bytes) -> None:
+        self.buffer += data
+
+
+class TestHTTPHandler(unittest.TestCase):
+    def test_upload_file_leaves_file_open(self) -> None:
+        content = os.urandom(200_000)
+        writer = _Writer()
+
+        async def request(*args, **kwargs):
+            # Send and release the payload as aiohttp would
+            payload = kwargs["data"]()
+            await payload.write(writer)
+            await payload.close()
+            return {"id": "test"}
+
+        http = HTTPHandler(token="token")
+        http.request = request  # type: ignore
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "file.bin")
+            with open(path, "wb") as f:
+                f.write(content)
+
+            with open(path, "rb") as f:
+                response = asyncio.run(http.upload_file(f, "attachments"))
+                assert not f.closed
+
+        assert response == {"id": "test"}
+        assert content in writer.buffer
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+from luster.channels import TextChannel
 from luster.permissions import PermissionOverwrite, Permissions
 
 
@@ -17,6 +18,37 @@ class TestPermissionOverwrites(unittest.TestCase):
         assert po.pair() == (allow, deny)
         assert PermissionOverwrite.from_pair(allow, deny) == po
 
+    def test_from_bits(self) -> None:
+        allow = Permissions(connect=True, view_channels=True)
+        deny = Permissions(send_messages=True)
+        first = PermissionOverwrite._from_bits(allow.value, deny.value)
+        second = PermissionOverwrite._from_bits(allow.value, deny.value)
+
+        assert first == PermissionOverwrite.from_pair(allow, deny)
+        assert first == second
+
+        first.speak = True
+        assert first != second
+
+    def test_channel_permissions_are_copies(self) -> None:
+        channel = TextChannel({
+            "_id": "01",
+            "channel_type": "TextChannel",
+            "server": "02",
+            "name": "general",
+            "default_permissions": {"a": 1, "d": 2},
+            "role_permissions": {"03": {"a": 4, "d": 0}},
+        }, state=None)  # type: ignore
+
+        default_permissions = channel.default_permissions
+        default_permissions.speak = True
+        assert channel.default_permissions != default_permissions
+
+        role_permissions = channel.role_permissions
+        role_permissions["03"].speak = True
+        role_permissions["04"] = PermissionOverwrite()
+        assert channel.role_permissions == {"03": PermissionOverwrite._from_bits(4, 0)}
+
 
 if __name__ == "__main__":
     unittest.main()
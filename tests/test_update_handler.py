@@ -0,0 +1,33 @@
+import unittest
+
+from luster.internal.update_handler import UpdateHandler, handle_update
+
+
+class _Model(UpdateHandler):
+    _UPDATE_MAP = {
+        "name": ("name", None),
+        "count": ("count", int),
+    }
+
+    def __init__(self) -> None:
+        self.name = None
+        self.count = 0
+        self.flag = False
+
+    @handle_update("flag")
+    def _handle_update_flag(self, new: bool) -> None:
+        self.flag = new
+
+
+class TestUpdateHandler(unittest.TestCase):
+    def test_update(self) -> None:
+        model = _Model()
+        model.update({"name": "test", "count": "2", "flag": True, "unknown": 1})  # type: ignore
+
+        assert model.name == "test"
+        assert model.count == 2
+        assert model.flag is True
+
+
+if __name__ == "__main__":
+    unittest.main()
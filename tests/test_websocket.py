@@ -0,0 +1,40 @@
+import asyncio
+import unittest
+
+from luster.internal.events_handler import EventsHandler
+from luster.websocket import WebsocketHandler
+from luster.events import Pong
+
+
+class TestWebsocketHandler(unittest.TestCase):
+    def test_bulk(self) -> None:
+        received = []
+
+        async def on_pong(event: Pong) -> None:
+            received.append(event.data)
+
+        async def run() -> WebsocketHandler:
+            websocket = WebsocketHandler(http_handler=None)  # type: ignore
+            handler = EventsHandler(state=None)  # type: ignore
+            handler.add_listener("Pong", on_pong)
+            websocket.set_events_handler(handler)
+
+            await websocket._WebsocketHandler__dispatch({  # type: ignore
+                "type": "Bulk",
+                "v": [
+                    {"type": "Pong", "data": 1},
+                    {"type": "Pong", "data": 2},
+                ],
+            })
+            await asyncio.gather(*handler._listener_tasks)
+            return websocket
+
+        websocket = asyncio.run(run())
+
+        # Bulked pongs acknowledge the ping like top level ones
+        assert websocket._WebsocketHandler__ping_ack_received.is_set()  # type: ignore
+        assert received == [1, 2]
+
+
+if __name__ == "__main__":
+    unittest.main()